@@ -2,12 +2,16 @@
 UKP Kickball Roster Manager - Flask Backend
 """
 from flask import Flask, jsonify, request, send_from_directory, session
-from functools import wraps
+from collections import Counter, defaultdict
+from functools import lru_cache, wraps
 import sqlite3
 import hashlib
+import hmac
 import os
+import threading
 import uuid
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from werkzeug.security import check_password_hash, generate_password_hash
 from werkzeug.utils import secure_filename
 
 app = Flask(__name__, static_folder='static', static_url_path='/static')
@@ -27,6 +31,20 @@ else:
 
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 
+# Game selectors only ever need the recent history
+GAMES_LIST_LIMIT = 50
+# Upper bound for ?limit= on the games list
+GAMES_LIST_MAX_LIMIT = 500
+
+# Bump whenever init_db or migrate_db change the schema
+SCHEMA_VERSION = 1
+
+# One long-lived connection per worker thread (see get_db)
+_db_local = threading.local()
+
+# Per-thread cap on cached_query results; public routes take arbitrary game ids
+QUERY_CACHE_MAX_ENTRIES = 256
+
 # Positions definition
 POSITIONS = [
     "Pitcher", "Catcher", "First Base", "Second Base", "Third Base",
@@ -47,17 +65,53 @@ def allowed_file(filename):
 
 
 def get_db():
-    """Get database connection"""
-    conn = sqlite3.connect(DB_NAME, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
+    """Get the database connection for the current thread.
+    
+    Each worker thread opens its connection once and reuses it for every
+    request, so the file open and PRAGMA setup are not paid per API call.
+    """
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        # Room for every distinct statement in the app, so parsed statements
+        # stay cached on the long-lived connection instead of being re-prepared.
+        # Implicit transactions take the write lock up front (BEGIN IMMEDIATE)
+        # instead of upgrading mid-transaction and failing with SQLITE_BUSY.
+        conn = sqlite3.connect(DB_NAME, check_same_thread=False, cached_statements=256,
+                               isolation_level='IMMEDIATE')
+        conn.row_factory = sqlite3.Row
+        conn.executescript('''
+            PRAGMA synchronous=NORMAL;
+            PRAGMA wal_autocheckpoint=1000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA mmap_size=134217728;
+        ''')
+        _db_local.conn = conn
     return conn
 
 
+@app.teardown_request
+def release_db(exc):
+    """Roll back anything a request left uncommitted on its thread's connection"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is not None and conn.in_transaction:
+        conn.rollback()
+
+
 def init_db():
     """Initialize the database with required tables"""
     conn = get_db()
     c = conn.cursor()
     
+    # Nothing to do when this database file already has the current schema
+    c.execute('PRAGMA user_version')
+    if c.fetchone()[0] >= SCHEMA_VERSION:
+        return
+    
+    # WAL lets the public View Lineup reads run while an editor is writing.
+    # The journal mode is stored in the database file, so set it once here.
+    c.execute('PRAGMA journal_mode=WAL')
+    
     # Users table
     c.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -149,9 +203,21 @@ def init_db():
         )
     ''')
     
+    # Indexes for the per-game lookups done on every lineup view
+    # (idx_gps_game_status_order is created in migrate_db, once kicking_order exists)
+    # Lineup reads (grid, sit-outs, copy inning) are answered from these alone
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_lp_game_lineup
+                ON lineup_positions(game_id, inning, position, player_name)''')
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_pl_game_lineup
+                ON published_lineup(game_id, inning, position, player_name)''')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_ppo_game ON published_player_order(game_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date DESC)')
+    
     conn.commit()
-    conn.close()
     migrate_db()
+    # Only reached once every migration step has succeeded
+    c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    conn.commit()
 
 
 def migrate_db():
@@ -169,6 +235,11 @@ def migrate_db():
     except:
         pass
     
+    # Covers the IN-player list, its kicking order and MAX(kicking_order)
+    c.execute('''CREATE INDEX IF NOT EXISTS idx_gps_game_status_order
+                ON game_player_status(game_id, status, kicking_order, player_name)''')
+    conn.commit()
+    
     # Add is_female column to main_roster if missing
     try:
         c.execute("PRAGMA table_info(main_roster)")
@@ -212,11 +283,30 @@ def migrate_db():
     except:
         pass
     
-    conn.close()
+    # One lineup row per player per inning, so a cell edit can upsert in place.
+    # Every lineup write depends on this index, so a failure here must not be
+    # swallowed: init_db would otherwise stamp the schema version and never retry.
+    c.execute('''DELETE FROM lineup_positions WHERE player_name IS NOT NULL AND id NOT IN
+                (SELECT MAX(id) FROM lineup_positions GROUP BY game_id, inning, player_name)''')
+    c.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_lp_game_player
+                ON lineup_positions(game_id, inning, player_name)''')
+    conn.commit()
 
 
 def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
+    return generate_password_hash(password)
+
+
+def is_legacy_hash(password_hash: str) -> bool:
+    """Unsalted SHA-256 hex digests from before passwords used a KDF"""
+    return '$' not in password_hash
+
+
+def verify_password(password_hash: str, password: str) -> bool:
+    if is_legacy_hash(password_hash):
+        # Legacy hashes are upgraded on their first successful login (see login)
+        return hmac.compare_digest(password_hash, hashlib.sha256(password.encode()).hexdigest())
+    return check_password_hash(password_hash, password)
 
 
 def login_required(f):
@@ -228,12 +318,149 @@ def login_required(f):
     return decorated_function
 
 
-def get_next_thursday() -> datetime:
-    today = datetime.now()
-    days_until_thursday = (3 - today.weekday()) % 7
-    if days_until_thursday == 0:
-        days_until_thursday = 7
-    return today + timedelta(days=days_until_thursday)
+def get_next_thursday() -> date:
+    return _next_thursday_after(date.today())
+
+
+@lru_cache(maxsize=1)
+def _next_thursday_after(today: date) -> date:
+    # 1-7 days ahead, so a Thursday maps to the following week
+    return today + timedelta(days=(2 - today.weekday()) % 7 + 1)
+
+
+def cached_query(loader):
+    """Memoize a read-only query helper until the database changes.
+    
+    Results live next to the thread's connection and are dropped as soon as
+    another connection commits (PRAGMA data_version) or this connection
+    modifies a row (total_changes), so writers never have to clear them.
+    Callers must treat the returned data as read-only. Entries are keyed only
+    by the loader's arguments and shared by every request on the thread, so
+    anything a result depends on (the game, the user) must be an argument;
+    never read session or request state inside a cached loader. Each thread
+    holds at most QUERY_CACHE_MAX_ENTRIES results and starts over when full.
+    """
+    @wraps(loader)
+    def wrapper(*args):
+        conn = get_db()
+        if conn.in_transaction:
+            # Never cache rows that may still be rolled back
+            return loader(*args)
+        version = (conn.execute('PRAGMA data_version').fetchone()[0], conn.total_changes)
+        if getattr(_db_local, 'cache_version', None) != version:
+            _db_local.cache = {}
+            _db_local.cache_version = version
+        key = (loader.__name__,) + args
+        if key not in _db_local.cache:
+            if len(_db_local.cache) >= QUERY_CACHE_MAX_ENTRIES:
+                _db_local.cache.clear()
+            _db_local.cache[key] = loader(*args)
+        return _db_local.cache[key]
+    return wrapper
+
+
+# ========== Cached Queries ==========
+@cached_query
+def load_main_roster():
+    c = get_db().execute('SELECT player_name, is_female FROM main_roster ORDER BY player_name')
+    return tuple({'name': row['player_name'], 'isFemale': bool(row['is_female'])} for row in c)
+
+
+@cached_query
+def load_substitutes():
+    c = get_db().execute('SELECT player_name, is_female FROM substitutes ORDER BY player_name')
+    return tuple({'name': row['player_name'], 'isFemale': bool(row['is_female'])} for row in c)
+
+
+@cached_query
+def load_genders():
+    """Map every roster and substitute name to is-female, built from the cached rosters"""
+    return {player['name']: player['isFemale'] for player in load_main_roster() + load_substitutes()}
+
+
+@cached_query
+def load_game_players(game_id):
+    """Main roster, substitutes and their statuses for a game in one query"""
+    c = get_db().execute('''SELECT 0 AS is_sub, mr.player_name AS player_name, mr.is_female AS is_female,
+                       gps.status, gps.is_substitute, gps.kicking_order
+                FROM main_roster mr
+                LEFT JOIN game_player_status gps ON gps.game_id = ? AND gps.player_name = mr.player_name
+                UNION ALL
+                SELECT 1 AS is_sub, s.player_name, s.is_female,
+                       gps.status, gps.is_substitute, gps.kicking_order
+                FROM substitutes s
+                LEFT JOIN game_player_status gps ON gps.game_id = ? AND gps.player_name = s.player_name
+                ORDER BY is_sub, player_name''', (game_id, game_id))
+    main_roster = []
+    substitutes = []
+    statuses = {}
+    for row in c:
+        player = {'name': row['player_name'], 'isFemale': bool(row['is_female'])}
+        (substitutes if row['is_sub'] else main_roster).append(player)
+        if row['status'] is not None:
+            statuses[row['player_name']] = {'status': row['status'], 'isSub': bool(row['is_substitute']),
+                                            'kickingOrder': row['kicking_order']}
+    return main_roster, substitutes, statuses
+
+
+@cached_query
+def load_available_players(game_id):
+    """Names of the players marked IN for a game, in kicking order"""
+    c = get_db().execute('''SELECT player_name, COALESCE(kicking_order, 999) as order_val
+                FROM game_player_status
+                WHERE game_id = ? AND status = 'IN'
+                ORDER BY order_val, player_name''', (game_id,))
+    return [row['player_name'] for row in c]
+
+
+def pivot_lineup(rows):
+    """Reshape (inning, position, player_name, is_out) rows into {inning: {player: position}},
+    counting the innings each player sits "Out" in the same pass"""
+    lineup = defaultdict(dict)
+    sit_outs = Counter()
+    for inning, position, player_name, is_out in rows:
+        lineup[inning][player_name] = position
+        if is_out:
+            sit_outs[player_name] += 1
+    return dict(lineup), dict(sit_outs)
+
+
+@cached_query
+def load_lineup(game_id):
+    c = get_db().execute('''SELECT inning, position, player_name, position = 'Out' AS is_out
+                FROM lineup_positions WHERE game_id = ? AND player_name IS NOT NULL
+                ORDER BY inning, position''', (game_id,))
+    return pivot_lineup(c)
+
+
+@cached_query
+def load_games(limit):
+    """Most recent games first, read in game_date order straight off idx_games_date"""
+    c = get_db().execute('''SELECT id, game_date, team_name, opponent_name, team_logo, is_published, published_at
+                FROM games ORDER BY game_date DESC LIMIT ?''', (limit,))
+    return [dict(row, is_published=bool(row['is_published'])) for row in c]
+
+
+@cached_query
+def load_game(game_id):
+    c = get_db().execute('''SELECT id, game_date, team_name, opponent_name, team_logo, is_published, published_at
+                FROM games WHERE id = ?''', (game_id,))
+    return c.fetchone()
+
+
+@cached_query
+def load_published_order(game_id):
+    c = get_db().execute('''SELECT player_name FROM published_player_order 
+                WHERE game_id = ? ORDER BY kicking_order, player_name''', (game_id,))
+    return tuple(row['player_name'] for row in c)
+
+
+@cached_query
+def load_published_lineup(game_id):
+    c = get_db().execute('''SELECT inning, position, player_name, position = 'Out' AS is_out
+                FROM published_lineup WHERE game_id = ? AND player_name IS NOT NULL
+                ORDER BY inning, position''', (game_id,))
+    return pivot_lineup(c)
 
 
 # Initialize database
@@ -277,9 +504,13 @@ def login():
     c = conn.cursor()
     c.execute('SELECT id, password_hash FROM users WHERE username = ?', (username,))
     user = c.fetchone()
-    conn.close()
     
-    if user and user['password_hash'] == hash_password(password):
+    if user and verify_password(user['password_hash'], password):
+        # Upgrade legacy SHA-256 hashes now that we have the plain password
+        if is_legacy_hash(user['password_hash']):
+            c.execute('UPDATE users SET password_hash = ? WHERE id = ?', (hash_password(password), user['id']))
+            conn.commit()
+        
         session['user_id'] = user['id']
         session['username'] = username
         return jsonify({'success': True, 'username': username})
@@ -308,17 +539,14 @@ def register():
     # Only allow registration if no users exist
     c.execute('SELECT COUNT(*) as cnt FROM users')
     if c.fetchone()['cnt'] > 0:
-        conn.close()
         return jsonify({'error': 'Users already exist'}), 400
     
     try:
         c.execute('INSERT INTO users (username, password_hash) VALUES (?, ?)',
                   (username, hash_password(password)))
         conn.commit()
-        conn.close()
         return jsonify({'success': True})
     except sqlite3.IntegrityError:
-        conn.close()
         return jsonify({'error': 'Username already exists'}), 400
 
 
@@ -328,7 +556,6 @@ def has_users():
     c = conn.cursor()
     c.execute('SELECT COUNT(*) as cnt FROM users')
     count = c.fetchone()['cnt']
-    conn.close()
     return jsonify({'hasUsers': count > 0})
 
 
@@ -339,8 +566,7 @@ def get_users():
     conn = get_db()
     c = conn.cursor()
     c.execute('SELECT id, username FROM users ORDER BY username')
-    users = [{'id': row['id'], 'username': row['username']} for row in c.fetchall()]
-    conn.close()
+    users = [{'id': row['id'], 'username': row['username']} for row in c]
     return jsonify(users)
 
 
@@ -365,10 +591,8 @@ def create_user():
         c.execute('INSERT INTO users (username, password_hash) VALUES (?, ?)',
                   (username, hash_password(password)))
         conn.commit()
-        conn.close()
         return jsonify({'success': True})
     except sqlite3.IntegrityError:
-        conn.close()
         return jsonify({'error': 'Username already exists'}), 400
 
 
@@ -383,19 +607,13 @@ def delete_user(user_id):
     c = conn.cursor()
     c.execute('DELETE FROM users WHERE id = ?', (user_id,))
     conn.commit()
-    conn.close()
     return jsonify({'success': True})
 
 
 # ========== Roster Routes ==========
 @app.route('/api/roster', methods=['GET'])
 def get_roster():
-    conn = get_db()
-    c = conn.cursor()
-    c.execute('SELECT player_name, is_female FROM main_roster ORDER BY player_name')
-    roster = [{'name': row['player_name'], 'isFemale': bool(row['is_female'])} for row in c.fetchall()]
-    conn.close()
-    return jsonify(roster)
+    return jsonify(load_main_roster())
 
 
 @app.route('/api/roster', methods=['POST'])
@@ -414,10 +632,8 @@ def add_player():
         c.execute('INSERT INTO main_roster (player_name, is_female) VALUES (?, ?)',
                   (name, 1 if is_female else 0))
         conn.commit()
-        conn.close()
         return jsonify({'success': True})
     except sqlite3.IntegrityError:
-        conn.close()
         return jsonify({'error': 'Player already exists'}), 400
 
 
@@ -428,7 +644,22 @@ def delete_player(name):
     c = conn.cursor()
     c.execute('DELETE FROM main_roster WHERE player_name = ?', (name,))
     conn.commit()
-    conn.close()
+    return jsonify({'success': True})
+
+
+@app.route('/api/roster', methods=['DELETE'])
+@login_required
+def delete_players():
+    """Delete several players from the main roster in one transaction"""
+    data = request.get_json(silent=True)
+    names = data.get('names') if isinstance(data, dict) else None
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        return jsonify({'error': 'A list of player names is required'}), 400
+    
+    conn = get_db()
+    c = conn.cursor()
+    c.executemany('DELETE FROM main_roster WHERE player_name = ?', [(name,) for name in names])
+    conn.commit()
     return jsonify({'success': True})
 
 
@@ -439,19 +670,13 @@ def toggle_player_gender(name):
     c = conn.cursor()
     c.execute('UPDATE main_roster SET is_female = NOT is_female WHERE player_name = ?', (name,))
     conn.commit()
-    conn.close()
     return jsonify({'success': True})
 
 
 # ========== Substitutes Routes ==========
 @app.route('/api/substitutes', methods=['GET'])
 def get_substitutes():
-    conn = get_db()
-    c = conn.cursor()
-    c.execute('SELECT player_name, is_female FROM substitutes ORDER BY player_name')
-    subs = [{'name': row['player_name'], 'isFemale': bool(row['is_female'])} for row in c.fetchall()]
-    conn.close()
-    return jsonify(subs)
+    return jsonify(load_substitutes())
 
 
 @app.route('/api/substitutes', methods=['POST'])
@@ -470,10 +695,8 @@ def add_substitute():
         c.execute('INSERT INTO substitutes (player_name, is_female) VALUES (?, ?)',
                   (name, 1 if is_female else 0))
         conn.commit()
-        conn.close()
         return jsonify({'success': True})
     except sqlite3.IntegrityError:
-        conn.close()
         return jsonify({'error': 'Substitute already exists'}), 400
 
 
@@ -484,7 +707,22 @@ def delete_substitute(name):
     c = conn.cursor()
     c.execute('DELETE FROM substitutes WHERE player_name = ?', (name,))
     conn.commit()
-    conn.close()
+    return jsonify({'success': True})
+
+
+@app.route('/api/substitutes', methods=['DELETE'])
+@login_required
+def delete_substitutes():
+    """Delete several substitutes in one transaction"""
+    data = request.get_json(silent=True)
+    names = data.get('names') if isinstance(data, dict) else None
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        return jsonify({'error': 'A list of substitute names is required'}), 400
+    
+    conn = get_db()
+    c = conn.cursor()
+    c.executemany('DELETE FROM substitutes WHERE player_name = ?', [(name,) for name in names])
+    conn.commit()
     return jsonify({'success': True})
 
 
@@ -495,35 +733,17 @@ def toggle_substitute_gender(name):
     c = conn.cursor()
     c.execute('UPDATE substitutes SET is_female = NOT is_female WHERE player_name = ?', (name,))
     conn.commit()
-    conn.close()
     return jsonify({'success': True})
 
 
 # ========== Games Routes ==========
 @app.route('/api/games', methods=['GET'])
 def get_games():
-    conn = get_db()
-    c = conn.cursor()
-    
-    # Check if is_published column exists (for backward compatibility)
-    c.execute("PRAGMA table_info(games)")
-    columns = [row[1] for row in c.fetchall()]
-    has_publish_columns = 'is_published' in columns
-    
-    if has_publish_columns:
-        c.execute('SELECT id, game_date, team_name, opponent_name, team_logo, is_published, published_at FROM games ORDER BY game_date DESC')
-    else:
-        c.execute('SELECT id, game_date, team_name, opponent_name, team_logo FROM games ORDER BY game_date DESC')
-    
-    games = []
-    for row in c.fetchall():
-        game = dict(row)
-        game['is_published'] = bool(game.get('is_published')) if has_publish_columns else False
-        if not has_publish_columns:
-            game['published_at'] = None
-        games.append(game)
-    conn.close()
-    return jsonify(games)
+    """List the most recent games, newest first"""
+    limit = request.args.get('limit', GAMES_LIST_LIMIT, type=int)
+    # Clamp so a negative limit can't return the whole table and the cache sees few keys
+    limit = min(max(limit, 1), GAMES_LIST_MAX_LIMIT)
+    return jsonify(load_games(limit))
 
 
 @app.route('/api/games/current', methods=['GET'])
@@ -532,35 +752,17 @@ def get_current_game():
     conn = get_db()
     c = conn.cursor()
     
-    # Check if is_published column exists
-    c.execute("PRAGMA table_info(games)")
-    columns = [row[1] for row in c.fetchall()]
-    has_publish_columns = 'is_published' in columns
-    
-    next_thursday = get_next_thursday().date()
-    
-    if has_publish_columns:
-        c.execute('SELECT id, game_date, team_name, opponent_name, team_logo, is_published, published_at FROM games WHERE game_date = ?',
-                  (next_thursday,))
-    else:
-        c.execute('SELECT id, game_date, team_name, opponent_name, team_logo FROM games WHERE game_date = ?',
-                  (next_thursday,))
+    next_thursday = get_next_thursday().isoformat()
     
+    c.execute('SELECT id, game_date, team_name, opponent_name, team_logo, is_published, published_at FROM games WHERE game_date = ?',
+              (next_thursday,))
     game = c.fetchone()
     
     if not game:
         # Return null to indicate no game exists (don't auto-create)
-        conn.close()
-        return jsonify({'exists': False, 'next_thursday': str(next_thursday)})
-    
-    game = dict(game)
-    game['exists'] = True
-    game['is_published'] = bool(game.get('is_published')) if has_publish_columns else False
-    if not has_publish_columns:
-        game['published_at'] = None
+        return jsonify({'exists': False, 'next_thursday': next_thursday})
     
-    conn.close()
-    return jsonify(game)
+    return jsonify(dict(game, exists=True, is_published=bool(game['is_published'])))
 
 
 @app.route('/api/games', methods=['POST'])
@@ -582,7 +784,6 @@ def create_game():
               (game_date, team_name, opponent_name))
     game_id = c.lastrowid
     conn.commit()
-    conn.close()
     
     return jsonify({
         'id': game_id,
@@ -621,35 +822,16 @@ def delete_game(game_id):
     c.execute('DELETE FROM games WHERE id = ?', (game_id,))
     
     conn.commit()
-    conn.close()
     
     return jsonify({'success': True})
 
 
 @app.route('/api/games/<int:game_id>', methods=['GET'])
 def get_game(game_id):
-    conn = get_db()
-    c = conn.cursor()
-    
-    # Check if is_published column exists
-    c.execute("PRAGMA table_info(games)")
-    columns = [row[1] for row in c.fetchall()]
-    has_publish_columns = 'is_published' in columns
-    
-    if has_publish_columns:
-        c.execute('SELECT id, game_date, team_name, opponent_name, team_logo, is_published, published_at FROM games WHERE id = ?', (game_id,))
-    else:
-        c.execute('SELECT id, game_date, team_name, opponent_name, team_logo FROM games WHERE id = ?', (game_id,))
-    
-    game = c.fetchone()
-    conn.close()
+    game = load_game(game_id)
     
     if game:
-        game_dict = dict(game)
-        game_dict['is_published'] = bool(game_dict.get('is_published')) if has_publish_columns else False
-        if not has_publish_columns:
-            game_dict['published_at'] = None
-        return jsonify(game_dict)
+        return jsonify(dict(game, is_published=bool(game['is_published'])))
     return jsonify({'error': 'Game not found'}), 404
 
 
@@ -659,11 +841,13 @@ def update_game(game_id):
     data = request.json
     conn = get_db()
     c = conn.cursor()
+    game_date, team_name, opponent_name = data.get('game_date'), data.get('team_name'), data.get('opponent_name')
+    # Only write (and bump updated_at) when a field actually changed
     c.execute('''UPDATE games SET game_date = ?, team_name = ?, opponent_name = ?, 
-                updated_at = CURRENT_TIMESTAMP WHERE id = ?''',
-              (data.get('game_date'), data.get('team_name'), data.get('opponent_name'), game_id))
+                updated_at = CURRENT_TIMESTAMP
+                WHERE id = ? AND (game_date IS NOT ? OR team_name IS NOT ? OR opponent_name IS NOT ?)''',
+              (game_date, team_name, opponent_name, game_id, game_date, team_name, opponent_name))
     conn.commit()
-    conn.close()
     return jsonify({'success': True})
 
 
@@ -699,7 +883,6 @@ def upload_logo(game_id):
         # Update database
         c.execute('UPDATE games SET team_logo = ? WHERE id = ?', (filename, game_id))
         conn.commit()
-        conn.close()
         
         return jsonify({'success': True, 'logo': filename})
     
@@ -722,7 +905,6 @@ def delete_logo(game_id):
         c.execute('UPDATE games SET team_logo = NULL WHERE id = ?', (game_id,))
         conn.commit()
     
-    conn.close()
     return jsonify({'success': True})
 
 
@@ -732,38 +914,32 @@ def get_game_status(game_id):
     conn = get_db()
     c = conn.cursor()
     
-    # Get main roster
-    c.execute('SELECT player_name, is_female FROM main_roster ORDER BY player_name')
-    main_roster = [{'name': row['player_name'], 'isFemale': bool(row['is_female'])} for row in c.fetchall()]
-    
-    # Get substitutes
-    c.execute('SELECT player_name, is_female FROM substitutes ORDER BY player_name')
-    substitutes = [{'name': row['player_name'], 'isFemale': bool(row['is_female'])} for row in c.fetchall()]
-    
-    # Get existing statuses
-    c.execute('''SELECT player_name, status, is_substitute, kicking_order 
-                FROM game_player_status WHERE game_id = ?''', (game_id,))
-    existing_statuses = {row['player_name']: {'status': row['status'], 'isSub': bool(row['is_substitute']),
-                                               'kickingOrder': row['kicking_order']} for row in c.fetchall()}
+    main_roster, substitutes, existing_statuses = load_game_players(game_id)
     
     # Auto-initialize main roster players as IN if they don't have a status yet
     statuses = {}
-    max_order = 0
-    
-    # Get current max kicking order
-    c.execute('SELECT COALESCE(MAX(kicking_order), 0) FROM game_player_status WHERE game_id = ?', (game_id,))
-    max_order = c.fetchone()[0] or 0
+    missing = [player['name'] for player in main_roster if player['name'] not in existing_statuses]
+    
+    if missing:
+        # Add every missing player in one statement, numbered in roster (name) order after
+        # the current max kicking order, which is read by the same statement
+        c.execute('''INSERT INTO game_player_status (game_id, player_name, status, is_substitute, kicking_order)
+                    SELECT ?, mr.player_name, 'IN', 0,
+                           (SELECT COALESCE(MAX(kicking_order), 0) FROM game_player_status WHERE game_id = ?)
+                           + ROW_NUMBER() OVER (ORDER BY mr.player_name)
+                    FROM main_roster mr
+                    WHERE NOT EXISTS (SELECT 1 FROM game_player_status gps
+                                      WHERE gps.game_id = ? AND gps.player_name = mr.player_name)
+                    ON CONFLICT(game_id, player_name) DO NOTHING''', (game_id, game_id, game_id))
+        conn.commit()
+        
+        # Re-read so the response matches what was stored, even if another request got there first
+        main_roster, substitutes, existing_statuses = load_game_players(game_id)
     
     for player in main_roster:
         name = player['name']
         if name in existing_statuses:
             statuses[name] = existing_statuses[name]
-        else:
-            # Auto-add main roster player as IN
-            max_order += 1
-            c.execute('''INSERT INTO game_player_status (game_id, player_name, status, is_substitute, kicking_order)
-                        VALUES (?, ?, 'IN', 0, ?)''', (game_id, name, max_order))
-            statuses[name] = {'status': 'IN', 'isSub': False, 'kickingOrder': max_order}
     
     # For substitutes, keep existing status or default to OUT (don't auto-add)
     for player in substitutes:
@@ -774,9 +950,6 @@ def get_game_status(game_id):
             # Substitutes default to OUT - don't insert, just return the default
             statuses[name] = {'status': 'OUT', 'isSub': True, 'kickingOrder': None}
     
-    conn.commit()
-    conn.close()
-    
     return jsonify({
         'mainRoster': main_roster,
         'substitutes': substitutes,
@@ -789,72 +962,85 @@ def get_game_status(game_id):
 def toggle_player_status(game_id, player_name):
     conn = get_db()
     c = conn.cursor()
+    # Read and write under one write lock so concurrent edits can't interleave
+    c.execute('BEGIN IMMEDIATE')
+    
+    # Keyed lookups only: the cached loaders are bypassed inside a transaction
+    is_sub, current_status = c.execute('''SELECT EXISTS(SELECT 1 FROM substitutes WHERE player_name = ?),
+                       (SELECT status FROM game_player_status WHERE game_id = ? AND player_name = ?)''',
+                                      (player_name, game_id, player_name)).fetchone()
+    if current_status is None:
+        current_status = 'OUT' if is_sub else 'IN'
+    new_status = 'OUT' if current_status == 'IN' else 'IN'
+    
+    # One upsert; a player coming IN goes to the end of the kicking order
+    c.execute('''INSERT INTO game_player_status (game_id, player_name, status, is_substitute, kicking_order)
+               VALUES (?, ?, ?, ?, CASE WHEN ? = 'IN' THEN
+                   (SELECT COALESCE(MAX(kicking_order), 0) + 1 FROM game_player_status
+                    WHERE game_id = ? AND status = 'IN') END)
+               ON CONFLICT(game_id, player_name) DO UPDATE SET status = excluded.status,
+                   is_substitute = excluded.is_substitute, kicking_order = excluded.kicking_order''',
+              (game_id, player_name, new_status, 1 if is_sub else 0, new_status, game_id))
+    conn.commit()
     
-    # Check if substitute
-    c.execute('SELECT COUNT(*) as cnt FROM substitutes WHERE player_name = ?', (player_name,))
-    is_sub = c.fetchone()['cnt'] > 0
+    return jsonify({'success': True, 'newStatus': new_status,
+                    'availablePlayers': load_available_players(game_id)})
+
+
+@app.route('/api/games/<int:game_id>/status', methods=['PUT'])
+@login_required
+def update_player_statuses(game_id):
+    """Set IN/OUT for several players in one transaction"""
+    data = request.get_json(silent=True)
+    changes = data.get('statuses') if isinstance(data, dict) else None
     
-    # Get current status
-    c.execute('SELECT status FROM game_player_status WHERE game_id = ? AND player_name = ?',
-              (game_id, player_name))
-    result = c.fetchone()
-    current_status = result['status'] if result else ('OUT' if is_sub else 'IN')
+    if not isinstance(changes, dict):
+        return jsonify({'error': 'Statuses must map player names to IN or OUT'}), 400
+    if any(status not in ('IN', 'OUT') for status in changes.values()):
+        return jsonify({'error': 'Status must be IN or OUT'}), 400
+    
+    conn = get_db()
+    c = conn.cursor()
+    # Read and write under one write lock so concurrent edits can't interleave
+    c.execute('BEGIN IMMEDIATE')
+    
+    c.execute('SELECT COALESCE(MAX(kicking_order), 0) FROM game_player_status WHERE game_id = ? AND status = ?',
+              (game_id, 'IN'))
+    max_order = c.fetchone()[0] or 0
     
-    if current_status == 'IN':
-        new_status = 'OUT'
+    rows = []
+    for player_name, new_status in changes.items():
+        # Keyed lookups only: the cached loaders are bypassed inside a transaction
+        is_sub, current_status = c.execute('''SELECT EXISTS(SELECT 1 FROM substitutes WHERE player_name = ?),
+                           (SELECT status FROM game_player_status WHERE game_id = ? AND player_name = ?)''',
+                                          (player_name, game_id, player_name)).fetchone()
+        if current_status == new_status:
+            continue
+        
         kicking_order = None
-    else:
-        new_status = 'IN'
-        c.execute('SELECT COALESCE(MAX(kicking_order), 0) FROM game_player_status WHERE game_id = ? AND status = ?',
-                  (game_id, 'IN'))
-        max_order = c.fetchone()[0] or 0
-        kicking_order = max_order + 1
-    
-    c.execute('''INSERT OR REPLACE INTO game_player_status 
-               (game_id, player_name, status, is_substitute, kicking_order) VALUES (?, ?, ?, ?, ?)''',
-              (game_id, player_name, new_status, 1 if is_sub else 0, kicking_order))
+        if new_status == 'IN':
+            max_order += 1
+            kicking_order = max_order
+        rows.append((game_id, player_name, new_status, 1 if is_sub else 0, kicking_order))
+    
+    c.executemany('''INSERT OR REPLACE INTO game_player_status
+                   (game_id, player_name, status, is_substitute, kicking_order) VALUES (?, ?, ?, ?, ?)''', rows)
     conn.commit()
-    conn.close()
     
-    return jsonify({'success': True, 'newStatus': new_status})
+    return jsonify({'success': True, 'statuses': changes,
+                    'availablePlayers': load_available_players(game_id)})
 
 
 # ========== Lineup Routes ==========
 @app.route('/api/games/<int:game_id>/lineup', methods=['GET'])
 def get_lineup(game_id):
-    conn = get_db()
-    c = conn.cursor()
-    
-    # Get available players in kicking order
-    c.execute('''SELECT player_name, COALESCE(kicking_order, 999) as order_val 
-                FROM game_player_status 
-                WHERE game_id = ? AND status = 'IN' 
-                ORDER BY order_val, player_name''', (game_id,))
-    available_players = [row['player_name'] for row in c.fetchall()]
+    available_players = load_available_players(game_id)
     
     # Get player genders
-    c.execute('SELECT player_name, is_female FROM main_roster')
-    genders = {row['player_name']: bool(row['is_female']) for row in c.fetchall()}
-    c.execute('SELECT player_name, is_female FROM substitutes')
-    for row in c.fetchall():
-        genders[row['player_name']] = bool(row['is_female'])
-    
-    # Get lineup positions
-    c.execute('''SELECT inning, position, player_name FROM lineup_positions 
-                WHERE game_id = ? ORDER BY inning, position''', (game_id,))
-    lineup = {}
-    for row in c.fetchall():
-        inning = row['inning']
-        if inning not in lineup:
-            lineup[inning] = {}
-        lineup[inning][row['player_name']] = row['position']
-    
-    # Get sit-out counts
-    c.execute('''SELECT player_name, COUNT(*) as cnt FROM lineup_positions 
-                WHERE game_id = ? AND position = 'Out' GROUP BY player_name''', (game_id,))
-    sitOutCounts = {row['player_name']: row['cnt'] for row in c.fetchall()}
-    
-    conn.close()
+    genders = load_genders()
+    
+    lineup, sitOutCounts = load_lineup(game_id)
+    
     return jsonify({
         'availablePlayers': available_players,
         'genders': genders,
@@ -874,18 +1060,56 @@ def update_lineup_position(game_id, player_name, inning):
     conn = get_db()
     c = conn.cursor()
     
-    # Delete old position for this player in this inning
-    c.execute('''DELETE FROM lineup_positions 
-               WHERE game_id = ? AND inning = ? AND player_name = ?''',
-              (game_id, inning, player_name))
-    
-    # Insert new position if not empty
     if new_position:
+        # Set the position in place, creating the player's row for this inning if needed
         c.execute('''INSERT INTO lineup_positions (game_id, inning, position, player_name) 
-                    VALUES (?, ?, ?, ?)''', (game_id, inning, new_position, player_name))
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(game_id, inning, player_name) DO UPDATE SET position = excluded.position''',
+                  (game_id, inning, new_position, player_name))
+    else:
+        c.execute('''DELETE FROM lineup_positions 
+                   WHERE game_id = ? AND inning = ? AND player_name = ?''',
+                  (game_id, inning, player_name))
+    
+    conn.commit()
+    return jsonify({'success': True})
+
+
+def is_valid_lineup_change(change) -> bool:
+    """A {player, inning, position} cell edit; an empty position clears the cell"""
+    if not isinstance(change, dict):
+        return False
+    player = change.get('player')
+    inning = change.get('inning')
+    position = change.get('position')
+    return (isinstance(player, str) and player != ''
+            and type(inning) is int and 1 <= inning <= 7
+            and (not position or position in POSITIONS))
+
+
+@app.route('/api/games/<int:game_id>/lineup', methods=['PUT'])
+@login_required
+def update_lineup_positions(game_id):
+    """Save several lineup cells in one transaction"""
+    data = request.get_json(silent=True)
+    changes = data.get('positions') if isinstance(data, dict) else None
+    
+    if not isinstance(changes, list) or not all(is_valid_lineup_change(change) for change in changes):
+        return jsonify({'error': 'Each change needs a player, an inning from 1 to 7 and a known position'}), 400
+    
+    conn = get_db()
+    c = conn.cursor()
+    
+    c.executemany('''INSERT INTO lineup_positions (game_id, inning, position, player_name) 
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(game_id, inning, player_name) DO UPDATE SET position = excluded.position''',
+                  [(game_id, change['inning'], change['position'], change['player'])
+                   for change in changes if change.get('position')])
+    c.executemany('DELETE FROM lineup_positions WHERE game_id = ? AND inning = ? AND player_name = ?',
+                  [(game_id, change['inning'], change['player'])
+                   for change in changes if not change.get('position')])
     
     conn.commit()
-    conn.close()
     return jsonify({'success': True})
 
 
@@ -895,21 +1119,15 @@ def copy_inning(game_id):
     conn = get_db()
     c = conn.cursor()
     
-    # Get inning 1 positions
-    c.execute('SELECT position, player_name FROM lineup_positions WHERE game_id = ? AND inning = 1',
-              (game_id,))
-    first_inning = c.fetchall()
-    
-    # Copy to innings 2-7
-    for inning_num in range(2, 8):
-        c.execute('DELETE FROM lineup_positions WHERE game_id = ? AND inning = ?', (game_id, inning_num))
-        for row in first_inning:
-            if row['position']:
-                c.execute('INSERT INTO lineup_positions (game_id, inning, position, player_name) VALUES (?, ?, ?, ?)',
-                          (game_id, inning_num, row['position'], row['player_name']))
+    # Copy inning 1 to innings 2-7 inside SQLite, without pulling the rows into Python
+    c.execute('DELETE FROM lineup_positions WHERE game_id = ? AND inning BETWEEN 2 AND 7', (game_id,))
+    c.execute('''WITH innings(inning) AS (VALUES (2), (3), (4), (5), (6), (7))
+                INSERT INTO lineup_positions (game_id, inning, position, player_name)
+                SELECT lp.game_id, innings.inning, lp.position, lp.player_name
+                FROM lineup_positions lp, innings
+                WHERE lp.game_id = ? AND lp.inning = 1 AND lp.position != '' ''', (game_id,))
     
     conn.commit()
-    conn.close()
     return jsonify({'success': True})
 
 
@@ -920,7 +1138,6 @@ def reset_lineup(game_id):
     c = conn.cursor()
     c.execute('DELETE FROM lineup_positions WHERE game_id = ?', (game_id,))
     conn.commit()
-    conn.close()
     return jsonify({'success': True})
 
 
@@ -932,34 +1149,39 @@ def update_player_order(game_id, player_name):
     
     conn = get_db()
     c = conn.cursor()
+    # Read and write under one write lock so concurrent edits can't interleave
+    c.execute('BEGIN IMMEDIATE')
     
     # Get current player's order
     c.execute('SELECT kicking_order FROM game_player_status WHERE game_id = ? AND player_name = ?',
               (game_id, player_name))
-    current_order = c.fetchone()['kicking_order']
-    
-    if direction == 'up':
-        # Find player above
-        c.execute('''SELECT player_name, kicking_order FROM game_player_status 
-                    WHERE game_id = ? AND status = 'IN' AND kicking_order < ?
-                    ORDER BY kicking_order DESC LIMIT 1''', (game_id, current_order))
-    else:
-        # Find player below
-        c.execute('''SELECT player_name, kicking_order FROM game_player_status 
-                    WHERE game_id = ? AND status = 'IN' AND kicking_order > ?
-                    ORDER BY kicking_order ASC LIMIT 1''', (game_id, current_order))
+    row = c.fetchone()
+    current_order = row['kicking_order'] if row else None
+    
+    swap_player = None
+    if current_order is not None:
+        if direction == 'up':
+            # Find player above
+            c.execute('''SELECT kicking_order, player_name FROM game_player_status
+                        WHERE game_id = ? AND status = 'IN' AND kicking_order < ?
+                        ORDER BY kicking_order DESC, player_name DESC LIMIT 1''', (game_id, current_order))
+        else:
+            # Find player below
+            c.execute('''SELECT kicking_order, player_name FROM game_player_status
+                        WHERE game_id = ? AND status = 'IN' AND kicking_order > ?
+                        ORDER BY kicking_order, player_name LIMIT 1''', (game_id, current_order))
+        swap_player = c.fetchone()
     
-    swap_player = c.fetchone()
     if swap_player:
         # Swap orders
-        c.execute('UPDATE game_player_status SET kicking_order = ? WHERE game_id = ? AND player_name = ?',
-                  (swap_player['kicking_order'], game_id, player_name))
-        c.execute('UPDATE game_player_status SET kicking_order = ? WHERE game_id = ? AND player_name = ?',
-                  (current_order, game_id, swap_player['player_name']))
-        conn.commit()
+        swap_order, swap_name = swap_player
+        c.execute('''UPDATE game_player_status
+                    SET kicking_order = CASE player_name WHEN ? THEN ? ELSE ? END
+                    WHERE game_id = ? AND player_name IN (?, ?)''',
+                  (player_name, swap_order, current_order, game_id, player_name, swap_name))
+    conn.commit()
     
-    conn.close()
-    return jsonify({'success': True})
+    return jsonify({'success': True, 'availablePlayers': load_available_players(game_id)})
 
 
 # ========== Publish Routes ==========
@@ -989,7 +1211,6 @@ def publish_lineup(game_id):
               (game_id,))
     
     conn.commit()
-    conn.close()
     
     return jsonify({'success': True, 'published': True})
 
@@ -1009,32 +1230,17 @@ def unpublish_lineup(game_id):
     c.execute('''UPDATE games SET is_published = 0, published_at = NULL WHERE id = ?''', (game_id,))
     
     conn.commit()
-    conn.close()
     
     return jsonify({'success': True, 'published': False})
 
 
-@app.route('/api/games/<int:game_id>/lineup/published', methods=['GET'])
-def get_published_lineup(game_id):
-    """Get the published lineup for public viewing"""
-    conn = get_db()
-    c = conn.cursor()
-    
-    # Check if is_published column exists
-    c.execute("PRAGMA table_info(games)")
-    columns = [row[1] for row in c.fetchall()]
-    has_publish_columns = 'is_published' in columns
-    
+def render_published_lineup(game_id):
+    """Serialize the public lineup for a game"""
     # Check if game is published
-    is_published = False
-    if has_publish_columns:
-        c.execute('SELECT is_published FROM games WHERE id = ?', (game_id,))
-        game = c.fetchone()
-        is_published = game and bool(game['is_published'])
-    
-    if not is_published:
-        conn.close()
-        return jsonify({
+    game = load_game(game_id)
+    
+    if not game or not game['is_published']:
+        return app.json.response({
             'published': False,
             'availablePlayers': [],
             'genders': {},
@@ -1042,37 +1248,17 @@ def get_published_lineup(game_id):
             'sitOutCounts': {},
             'positions': POSITIONS,
             'abbreviations': POSITION_ABBREVIATIONS
-        })
+        }).get_data()
     
     # Get published player order
-    c.execute('''SELECT player_name, kicking_order FROM published_player_order 
-                WHERE game_id = ? ORDER BY kicking_order, player_name''', (game_id,))
-    available_players = [row['player_name'] for row in c.fetchall()]
+    available_players = load_published_order(game_id)
     
     # Get player genders
-    c.execute('SELECT player_name, is_female FROM main_roster')
-    genders = {row['player_name']: bool(row['is_female']) for row in c.fetchall()}
-    c.execute('SELECT player_name, is_female FROM substitutes')
-    for row in c.fetchall():
-        genders[row['player_name']] = bool(row['is_female'])
-    
-    # Get published lineup positions
-    c.execute('''SELECT inning, position, player_name FROM published_lineup 
-                WHERE game_id = ? ORDER BY inning, position''', (game_id,))
-    lineup = {}
-    for row in c.fetchall():
-        inning = row['inning']
-        if inning not in lineup:
-            lineup[inning] = {}
-        lineup[inning][row['player_name']] = row['position']
-    
-    # Get sit-out counts from published lineup
-    c.execute('''SELECT player_name, COUNT(*) as cnt FROM published_lineup 
-                WHERE game_id = ? AND position = 'Out' GROUP BY player_name''', (game_id,))
-    sitOutCounts = {row['player_name']: row['cnt'] for row in c.fetchall()}
-    
-    conn.close()
-    return jsonify({
+    genders = load_genders()
+    
+    lineup, sitOutCounts = load_published_lineup(game_id)
+    
+    return app.json.response({
         'published': True,
         'availablePlayers': available_players,
         'genders': genders,
@@ -1080,7 +1266,25 @@ def get_published_lineup(game_id):
         'sitOutCounts': sitOutCounts,
         'positions': POSITIONS,
         'abbreviations': POSITION_ABBREVIATIONS
-    })
+    }).get_data()
+
+
+@cached_query
+def published_lineup_response(game_id):
+    """Body and ETag of the public lineup, computed once per database version"""
+    body = render_published_lineup(game_id)
+    return body, hashlib.sha1(body).hexdigest()
+
+
+@app.route('/api/games/<int:game_id>/lineup/published', methods=['GET'])
+def get_published_lineup(game_id):
+    """Get the published lineup for public viewing"""
+    body, etag = published_lineup_response(game_id)
+    response = app.response_class(body, mimetype='application/json')
+    # Browsers revalidate with If-None-Match and get an empty 304 while the lineup is unchanged
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 
 if __name__ == '__main__':
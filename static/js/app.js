@@ -19,11 +19,49 @@ const state = {
     genders: {},
     sitOutCounts: {},
     positions: [],
+    playingPositions: [],
     abbreviations: {},
     currentViewGameId: null,
     selectedPlayer: null
 };
 
+// IN/OUT toggles waiting to be saved in one batch
+const STATUS_FLUSH_DELAY_MS = 400;
+const pendingStatus = {
+    gameId: null,
+    changes: {},
+    previous: {},
+    timer: null
+};
+
+// Game date/team/opponent edits are saved together once the user pauses. The values
+// are captured when queued, since a re-render redraws the inputs from state.
+const GAME_DETAILS_SAVE_DELAY_MS = 800;
+const pendingGameDetails = {
+    gameId: null,
+    details: null,
+    timer: null
+};
+
+// Lineup cell edits waiting to be saved in one batch, keyed by "inning|player"
+const LINEUP_FLUSH_DELAY_MS = 400;
+const pendingLineup = {
+    gameId: null,
+    changes: {},
+    previous: {},
+    timer: null
+};
+
+// Save every queued edit now, e.g. before re-rendering, leaving the tab or the page.
+// Extra fetch options (keepalive on pagehide) are passed through to each request.
+function flushAll(options = {}) {
+    return Promise.all([
+        flushPlayerStatuses(options),
+        flushLineupPositions(options),
+        flushGameDetails(options)
+    ]);
+}
+
 // ========================================
 // API Helpers
 // ========================================
@@ -92,6 +130,9 @@ async function login(username, password) {
 }
 
 async function logout() {
+    // Queued edits would be rejected once the session is gone
+    await flushAll();
+    
     try {
         await api('/api/auth/logout', { method: 'POST' });
     } catch (error) {
@@ -174,7 +215,7 @@ function updateTabs() {
     }
 }
 
-function switchTab(tab) {
+async function switchTab(tab) {
     state.currentTab = tab;
     
     // Update tab buttons
@@ -196,6 +237,8 @@ function switchTab(tab) {
         buttons[activeIndex].classList.add('active');
     }
     
+    // The roster and View Lineup tabs read what is saved, so save queued edits first
+    await flushAll();
     loadCurrentTab();
 }
 
@@ -219,6 +262,9 @@ async function loadCurrentTab() {
 async function loadGameLineup() {
     if (!state.authenticated) return;
     
+    // Save any queued IN/OUT toggles, cell edits and game details before reloading
+    await flushAll();
+    
     const panel = document.getElementById('gameLineupPanel');
     panel.innerHTML = '<div class="loading"><div class="spinner"></div></div>';
     
@@ -236,7 +282,7 @@ async function loadGameLineup() {
             
             // If there are other games, load the first one; otherwise show create UI
             if (state.allGames.length > 0) {
-                await loadGameById(state.allGames[0].id);
+                await loadGameById(state.allGames[0].id, state.allGames);
             } else {
                 renderNoGameUI();
             }
@@ -258,6 +304,7 @@ async function loadGameLineup() {
         state.lineup = lineupData.lineup;
         state.sitOutCounts = lineupData.sitOutCounts;
         state.positions = lineupData.positions;
+        state.playingPositions = lineupData.positions.filter(p => p !== 'Out');
         state.abbreviations = lineupData.abbreviations;
         
         renderGameLineup();
@@ -313,7 +360,7 @@ function renderNoGameUI() {
             <div class="card-header">
                 <h3 class="card-title">Create New Game</h3>
             </div>
-            <form class="create-game-form" onsubmit="createNewGame(event)" style="padding: 0 var(--space-lg) var(--space-lg);">
+            <form class="create-game-form" onsubmit="createNewGame(event)">
                 <div class="form-row">
                     <div class="form-group">
                         <label for="newGameDate">Game Date</label>
@@ -360,15 +407,18 @@ async function createNewGame(event) {
     }
 }
 
-async function loadGameById(gameId) {
+async function loadGameById(gameId, allGames = null) {
     if (!state.authenticated) return;
     
+    // Save any queued IN/OUT toggles, cell edits and game details before reloading
+    await flushAll();
+    
     const panel = document.getElementById('gameLineupPanel');
     panel.innerHTML = '<div class="loading"><div class="spinner"></div></div>';
     
     try {
-        // Refresh all games list
-        state.allGames = await api('/api/games');
+        // Refresh all games list, unless the caller has just fetched it
+        state.allGames = allGames ?? await api('/api/games');
         
         // Load specific game
         state.currentGame = await api(`/api/games/${gameId}`);
@@ -386,6 +436,7 @@ async function loadGameById(gameId) {
         state.lineup = lineupData.lineup;
         state.sitOutCounts = lineupData.sitOutCounts;
         state.positions = lineupData.positions;
+        state.playingPositions = lineupData.positions.filter(p => p !== 'Out');
         state.abbreviations = lineupData.abbreviations;
         
         renderGameLineup();
@@ -402,8 +453,8 @@ function renderGameLineup() {
     const mainRosterHtml = state.mainRoster.map(player => {
         const status = state.playerStatuses[player.name]?.status || 'IN';
         return `
-            <button class="player-toggle status-${status.toLowerCase()}" 
-                    onclick="togglePlayerStatus('${escapeHtml(player.name)}')">
+            <button class="player-toggle status-${status.toLowerCase()}" data-name="${escapeHtml(player.name)}"
+                    onclick="togglePlayerStatus(this.dataset.name)">
                 ${escapeHtml(player.name)}${player.isFemale ? ' ♀' : ''}
             </button>
         `;
@@ -412,8 +463,8 @@ function renderGameLineup() {
     const substitutesHtml = state.substitutes.map(player => {
         const status = state.playerStatuses[player.name]?.status || 'OUT';
         return `
-            <button class="player-toggle status-${status.toLowerCase()}" 
-                    onclick="togglePlayerStatus('${escapeHtml(player.name)}')">
+            <button class="player-toggle status-${status.toLowerCase()}" data-name="${escapeHtml(player.name)}"
+                    onclick="togglePlayerStatus(this.dataset.name)">
                 ${escapeHtml(player.name)}${player.isFemale ? ' ♀' : ''}
             </button>
         `;
@@ -462,7 +513,7 @@ function renderGameLineup() {
     panel.innerHTML = `
         <div class="card">
             <div class="game-selector-header">
-                <div class="form-group" style="margin-bottom: 0; flex: 1;">
+                <div class="form-group">
                     <label>Select Game</label>
                     <select class="form-select" onchange="switchGame(this.value)">
                         ${gameSelectorOptions}
@@ -490,18 +541,18 @@ function renderGameLineup() {
                 <div class="form-group">
                     <label>Game Date</label>
                     <input type="date" class="form-input" id="gameDate" 
-                           value="${state.currentGame.game_date}" onchange="updateGameDetails()">
+                           value="${state.currentGame.game_date}" onchange="scheduleGameDetailsSave()">
                 </div>
                 <div class="form-group">
                     <label>Team Name</label>
                     <input type="text" class="form-input" id="teamName" 
-                           value="${escapeHtml(state.currentGame.team_name)}" onchange="updateGameDetails()">
+                           value="${escapeHtml(state.currentGame.team_name)}" onchange="scheduleGameDetailsSave()">
                 </div>
                 <div class="form-group">
                     <label>Opponent</label>
                     <input type="text" class="form-input" id="opponentName" 
                            value="${escapeHtml(state.currentGame.opponent_name || '')}" 
-                           placeholder="TBD" onchange="updateGameDetails()">
+                           placeholder="TBD" onchange="scheduleGameDetailsSave()">
                 </div>
             </div>
             
@@ -563,6 +614,26 @@ function renderGameLineup() {
             </div>
         </div>
     `;
+    
+    // The wrapper survives table re-renders, so one pair of delegated
+    // listeners covers every position select and order button
+    const tableWrapper = panel.querySelector('.lineup-table-wrapper');
+    tableWrapper.addEventListener('change', handleLineupChange);
+    tableWrapper.addEventListener('click', handleLineupClick);
+}
+
+function handleLineupChange(event) {
+    const select = event.target.closest('.position-select');
+    if (select) {
+        updatePosition(select.dataset.name, Number(select.dataset.inning), select.value);
+    }
+}
+
+function handleLineupClick(event) {
+    const button = event.target.closest('.order-btn');
+    if (button && !button.disabled) {
+        movePlayer(button.dataset.name, button.dataset.direction);
+    }
 }
 
 function buildLineupTable() {
@@ -577,12 +648,14 @@ function buildLineupTable() {
     let headerHtml = `
         <thead>
             <tr>
-                <th style="min-width: 180px;">Player</th>
-                <th style="width: 60px;">↑↓</th>
+                <th class="player-col">Player</th>
+                <th class="order-col">↑↓</th>
     `;
     
+    // One pass over the grid yields both the header warnings and the duplicate cells
+    const { inningStats, duplicateCells } = analyzeLineup();
     for (let i = 1; i <= 7; i++) {
-        const warnings = getInningWarnings(i);
+        const warnings = getInningWarnings(inningStats[i]);
         const warningIcon = warnings.length > 0 
             ? `<span class="inning-warning" title="${escapeHtml(warnings.join(' | '))}">⚠️</span>` 
             : '';
@@ -591,10 +664,22 @@ function buildLineupTable() {
     
     headerHtml += `<th>Out</th></tr></thead>`;
     
+    // The option list and the Out styling only depend on the selected
+    // position, so build each variant once per render instead of once per cell
+    const optionsFor = {};
+    const selectClassFor = {};
+    for (const selected of ['', ...state.positions]) {
+        optionsFor[selected] = '<option value="">-</option>' + state.positions.map(pos =>
+            `<option value="${pos}"${pos === selected ? ' selected' : ''}>${state.abbreviations[pos] || pos}</option>`
+        ).join('');
+        selectClassFor[selected] = selected === 'Out' ? 'position-select position-out' : 'position-select';
+    }
+    
     // Build body
     let bodyHtml = '<tbody>';
     
     state.availablePlayers.forEach((player, index) => {
+        const name = escapeHtml(player);
         const isFemale = state.genders[player] || false;
         const sitOutCount = state.sitOutCounts[player] || 0;
         
@@ -603,15 +688,15 @@ function buildLineupTable() {
                 <td>
                     <div class="player-name-cell">
                         <span class="player-order">${index + 1}.</span>
-                        <span class="player-name">${escapeHtml(player)}</span>
+                        <span class="player-name">${name}</span>
                         ${isFemale ? '<span class="gender-indicator">♀</span>' : ''}
                     </div>
                 </td>
                 <td>
                     <div class="order-buttons">
-                        <button class="order-btn" onclick="movePlayer('${escapeHtml(player)}', 'up')" 
+                        <button class="order-btn" data-name="${name}" data-direction="up" 
                                 ${index === 0 ? 'disabled' : ''}>↑</button>
-                        <button class="order-btn" onclick="movePlayer('${escapeHtml(player)}', 'down')" 
+                        <button class="order-btn" data-name="${name}" data-direction="down" 
                                 ${index === state.availablePlayers.length - 1 ? 'disabled' : ''}>↓</button>
                     </div>
                 </td>
@@ -619,21 +704,14 @@ function buildLineupTable() {
         
         for (let inning = 1; inning <= 7; inning++) {
             const position = state.lineup[inning]?.[player] || '';
-            const abbrev = position ? state.abbreviations[position] || position : '';
-            const isOut = position === 'Out';
-            const isDuplicate = checkDuplicatePosition(inning, position, player);
+            const isDuplicate = duplicateCells.has(`${inning}|${player}`);
             
             bodyHtml += `
                 <td>
-                    <select class="position-select ${isOut ? 'position-out' : ''} ${isDuplicate ? 'has-duplicate' : ''}"
-                            onchange="updatePosition('${escapeHtml(player)}', ${inning}, this.value)"
+                    <select class="${selectClassFor[position] ?? 'position-select'}${isDuplicate ? ' has-duplicate' : ''}"
+                            data-name="${name}" data-inning="${inning}"
                             ${isDuplicate ? `title="Duplicate position!"` : ''}>
-                        <option value="">-</option>
-                        ${state.positions.map(pos => `
-                            <option value="${pos}" ${position === pos ? 'selected' : ''}>
-                                ${state.abbreviations[pos] || pos}
-                            </option>
-                        `).join('')}
+                        ${optionsFor[position] ?? optionsFor['']}
                     </select>
                 </td>
             `;
@@ -650,27 +728,41 @@ function buildLineupTable() {
     return `<table class="lineup-table">${headerHtml}${bodyHtml}</table>`;
 }
 
-function getInningWarnings(inning) {
-    const warnings = [];
-    
-    // Count females on field
-    let femaleCount = 0;
-    const positionsUsed = new Set();
-    const duplicates = new Set();
+function analyzeLineup() {
+    // Per inning: female count, which player holds each field position, and
+    // duplicated positions; plus the "inning|player" cells that share a position
+    const inningStats = [];
+    for (let inning = 1; inning <= 7; inning++) {
+        inningStats[inning] = { femaleCount: 0, positionsUsed: new Map(), duplicates: new Set() };
+    }
+    const duplicateCells = new Set();
     
     for (const player of state.availablePlayers) {
-        const position = state.lineup[inning]?.[player];
-        if (position && position !== 'Out') {
-            if (state.genders[player]) {
-                femaleCount++;
+        const isFemale = state.genders[player];
+        for (let inning = 1; inning <= 7; inning++) {
+            const position = state.lineup[inning]?.[player];
+            if (!position || position === 'Out') continue;
+            
+            const inningStat = inningStats[inning];
+            if (isFemale) {
+                inningStat.femaleCount++;
             }
-            if (positionsUsed.has(position)) {
-                duplicates.add(position);
+            if (inningStat.positionsUsed.has(position)) {
+                inningStat.duplicates.add(position);
+                duplicateCells.add(`${inning}|${inningStat.positionsUsed.get(position)}`);
+                duplicateCells.add(`${inning}|${player}`);
+            } else {
+                inningStat.positionsUsed.set(position, player);
             }
-            positionsUsed.add(position);
         }
     }
     
+    return { inningStats, duplicateCells };
+}
+
+function getInningWarnings({ femaleCount, positionsUsed, duplicates }) {
+    const warnings = [];
+    
     if (femaleCount < 4 && positionsUsed.size > 0) {
         warnings.push(`Only ${femaleCount} females on field (need 4)`);
     }
@@ -680,64 +772,91 @@ function getInningWarnings(inning) {
         warnings.push(`Duplicate: ${dupAbbrevs.join(', ')}`);
     }
     
-    // Check for unused positions
-    const playingPositions = state.positions.filter(p => p !== 'Out');
-    const unused = playingPositions.filter(p => !positionsUsed.has(p));
-    if (unused.length > 0 && positionsUsed.size > 0) {
-        const unusedAbbrevs = unused.slice(0, 3).map(p => state.abbreviations[p] || p);
-        if (unused.length > 3) {
-            unusedAbbrevs.push(`+${unused.length - 3} more`);
+    // Check for unused positions (an empty inning gets no warnings, so skip it)
+    if (positionsUsed.size > 0) {
+        const unused = state.playingPositions.filter(p => !positionsUsed.has(p));
+        if (unused.length > 0) {
+            const unusedAbbrevs = unused.slice(0, 3).map(p => state.abbreviations[p] || p);
+            if (unused.length > 3) {
+                unusedAbbrevs.push(`+${unused.length - 3} more`);
+            }
+            warnings.push(`Unused: ${unusedAbbrevs.join(', ')}`);
         }
-        warnings.push(`Unused: ${unusedAbbrevs.join(', ')}`);
     }
     
     return warnings;
 }
 
-function checkDuplicatePosition(inning, position, currentPlayer) {
-    if (!position || position === 'Out' || position === '') return false;
-    
-    for (const player of state.availablePlayers) {
-        if (player !== currentPlayer && state.lineup[inning]?.[player] === position) {
-            return true;
-        }
+function togglePlayerStatus(playerName) {
+    const isSub = state.substitutes.some(p => p.name === playerName);
+    const currentStatus = state.playerStatuses[playerName]?.status || (isSub ? 'OUT' : 'IN');
+    const newStatus = currentStatus === 'IN' ? 'OUT' : 'IN';
+    
+    // Update local state
+    if (!state.playerStatuses[playerName]) {
+        state.playerStatuses[playerName] = {};
     }
+    state.playerStatuses[playerName].status = newStatus;
+    
+    // Update just the button that was clicked (no full page refresh)
+    setStatusButton(playerName, newStatus);
     
-    return false;
+    // Queue the change so a burst of clicks is saved with a single request,
+    // remembering the saved status in case the request fails
+    pendingStatus.gameId = state.currentGame.id;
+    pendingStatus.changes[playerName] = newStatus;
+    if (!(playerName in pendingStatus.previous)) {
+        pendingStatus.previous[playerName] = currentStatus;
+    }
+    clearTimeout(pendingStatus.timer);
+    pendingStatus.timer = setTimeout(flushPlayerStatuses, STATUS_FLUSH_DELAY_MS);
+}
+
+function setStatusButton(playerName, status) {
+    const button = document.querySelector(`.player-toggle[data-name="${CSS.escape(playerName)}"]`);
+    if (button) {
+        button.classList.remove('status-in', 'status-out');
+        button.classList.add(`status-${status.toLowerCase()}`);
+    }
 }
 
-async function togglePlayerStatus(playerName) {
+async function flushPlayerStatuses(options = {}) {
+    clearTimeout(pendingStatus.timer);
+    const { gameId, changes, previous } = pendingStatus;
+    pendingStatus.gameId = null;
+    pendingStatus.changes = {};
+    pendingStatus.previous = {};
+    pendingStatus.timer = null;
+    
+    if (gameId === null || Object.keys(changes).length === 0) return;
+    
     try {
-        const result = await api(`/api/games/${state.currentGame.id}/status/${encodeURIComponent(playerName)}`, {
-            method: 'PUT'
+        const result = await api(`/api/games/${gameId}/status`, {
+            method: 'PUT',
+            body: JSON.stringify({ statuses: changes }),
+            ...options
         });
         
-        // Update local state
-        if (!state.playerStatuses[playerName]) {
-            state.playerStatuses[playerName] = {};
-        }
-        state.playerStatuses[playerName].status = result.newStatus;
-        
-        // Update just the button that was clicked (no full page refresh)
-        const buttons = document.querySelectorAll('.player-toggle');
-        buttons.forEach(btn => {
-            if (btn.textContent.trim().replace(' ♀', '') === playerName) {
-                btn.classList.remove('status-in', 'status-out');
-                btn.classList.add(`status-${result.newStatus.toLowerCase()}`);
-            }
-        });
+        // Skip the refresh if the user has already moved to another game
+        if (!state.currentGame || state.currentGame.id !== gameId) return;
         
-        // Reload just the lineup data (available players list may have changed)
-        const lineupData = await api(`/api/games/${state.currentGame.id}/lineup`);
-        state.availablePlayers = lineupData.availablePlayers;
-        state.genders = lineupData.genders;
-        state.lineup = lineupData.lineup;
-        state.sitOutCounts = lineupData.sitOutCounts;
+        // Only the available players change with IN/OUT, and the response
+        // already carries them, so positions and genders are kept as-is
+        state.availablePlayers = result.availablePlayers;
         
         // Re-render just the lineup table
         updateLineupTable();
     } catch (error) {
-        console.error('Failed to toggle player status:', error);
+        console.error('Failed to update player statuses:', error);
+        
+        // The buttons were restyled before saving, so put back what is actually stored
+        if (state.currentGame && state.currentGame.id === gameId) {
+            for (const [playerName, status] of Object.entries(previous)) {
+                state.playerStatuses[playerName].status = status;
+                setStatusButton(playerName, status);
+            }
+        }
+        alert('Failed to save IN/OUT changes: ' + error.message);
     }
 }
 
@@ -757,18 +876,60 @@ function updateLineupTable() {
     window.scrollTo(0, scrollY);
 }
 
-async function updateGameDetails() {
+function scheduleGameDetailsSave() {
+    const game = state.currentGame;
+    const details = {
+        game_date: document.getElementById('gameDate').value,
+        team_name: document.getElementById('teamName').value.trim(),
+        opponent_name: document.getElementById('opponentName').value.trim()
+    };
+    
+    clearTimeout(pendingGameDetails.timer);
+    pendingGameDetails.timer = null;
+    
+    // Nothing to save when the fields are back to the stored values
+    if (details.game_date === game.game_date &&
+        details.team_name === (game.team_name || '') &&
+        details.opponent_name === (game.opponent_name || '')) {
+        pendingGameDetails.gameId = null;
+        pendingGameDetails.details = null;
+        return;
+    }
+    
+    pendingGameDetails.gameId = game.id;
+    pendingGameDetails.details = details;
+    pendingGameDetails.timer = setTimeout(flushGameDetails, GAME_DETAILS_SAVE_DELAY_MS);
+}
+
+async function flushGameDetails(options = {}) {
+    clearTimeout(pendingGameDetails.timer);
+    const { gameId, details } = pendingGameDetails;
+    pendingGameDetails.gameId = null;
+    pendingGameDetails.details = null;
+    pendingGameDetails.timer = null;
+    
+    if (gameId === null) return;
+    
     try {
-        await api(`/api/games/${state.currentGame.id}`, {
+        await api(`/api/games/${gameId}`, {
             method: 'PUT',
-            body: JSON.stringify({
-                game_date: document.getElementById('gameDate').value,
-                team_name: document.getElementById('teamName').value,
-                opponent_name: document.getElementById('opponentName').value
-            })
+            body: JSON.stringify(details),
+            ...options
         });
+        if (state.currentGame && state.currentGame.id === gameId) {
+            Object.assign(state.currentGame, details);
+        }
     } catch (error) {
         console.error('Failed to update game details:', error);
+        
+        // Show the stored values again rather than the unsaved ones
+        const game = state.currentGame;
+        if (game && game.id === gameId && document.getElementById('gameDate')) {
+            document.getElementById('gameDate').value = game.game_date;
+            document.getElementById('teamName').value = game.team_name || '';
+            document.getElementById('opponentName').value = game.opponent_name || '';
+        }
+        alert('Failed to save game details: ' + error.message);
     }
 }
 
@@ -780,6 +941,10 @@ async function deleteGame() {
     }
     
     try {
+        // Save queued edits now; the delete removes them with the game, while saving
+        // them after it (on the reload below) would leave orphan lineup rows
+        await flushAll();
+        
         await api(`/api/games/${state.currentGame.id}`, { method: 'DELETE' });
         
         // Reload the game lineup (will show create game UI if no game exists)
@@ -790,57 +955,99 @@ async function deleteGame() {
     }
 }
 
-async function updatePosition(player, inning, position) {
+function updatePosition(player, inning, position) {
+    // Store the old position to calculate sit-out count change
+    const oldPosition = state.lineup[inning]?.[player] || '';
+    
+    // Nothing was mutated, so skip both the request and the re-render
+    if (oldPosition === position) return;
+    
+    // Update local state
+    if (!state.lineup[inning]) {
+        state.lineup[inning] = {};
+    }
+    
+    if (position) {
+        state.lineup[inning][player] = position;
+    } else {
+        delete state.lineup[inning][player];
+    }
+    
+    // Update sit-out counts properly
+    // Decrement if moving FROM "Out"
+    if (oldPosition === 'Out' && position !== 'Out') {
+        state.sitOutCounts[player] = Math.max(0, (state.sitOutCounts[player] || 0) - 1);
+    }
+    // Increment if moving TO "Out"
+    if (position === 'Out' && oldPosition !== 'Out') {
+        state.sitOutCounts[player] = (state.sitOutCounts[player] || 0) + 1;
+    }
+    
+    // Re-render just the lineup table to update warnings and counts
+    updateLineupTable();
+    
+    // Queue the change so a run of cell edits is saved with a single request,
+    // remembering the saved position in case the request fails
+    const key = `${inning}|${player}`;
+    pendingLineup.gameId = state.currentGame.id;
+    pendingLineup.changes[key] = { player, inning: Number(inning), position };
+    if (!(key in pendingLineup.previous)) {
+        pendingLineup.previous[key] = { player, inning, position: oldPosition };
+    }
+    clearTimeout(pendingLineup.timer);
+    pendingLineup.timer = setTimeout(flushLineupPositions, LINEUP_FLUSH_DELAY_MS);
+}
+
+async function flushLineupPositions(options = {}) {
+    clearTimeout(pendingLineup.timer);
+    const { gameId, changes, previous } = pendingLineup;
+    pendingLineup.gameId = null;
+    pendingLineup.changes = {};
+    pendingLineup.previous = {};
+    pendingLineup.timer = null;
+    
+    if (gameId === null || Object.keys(changes).length === 0) return;
+    
     try {
-        // Store the old position to calculate sit-out count change
-        const oldPosition = state.lineup[inning]?.[player] || '';
-        
-        await api(`/api/games/${state.currentGame.id}/lineup/${encodeURIComponent(player)}/${inning}`, {
+        await api(`/api/games/${gameId}/lineup`, {
             method: 'PUT',
-            body: JSON.stringify({ position })
+            body: JSON.stringify({ positions: Object.values(changes) }),
+            ...options
         });
+    } catch (error) {
+        console.error('Failed to update positions:', error);
         
-        // Update local state
-        if (!state.lineup[inning]) {
-            state.lineup[inning] = {};
-        }
-        
-        if (position) {
-            state.lineup[inning][player] = position;
-        } else {
-            delete state.lineup[inning][player];
-        }
-        
-        // Update sit-out counts properly
-        // Decrement if moving FROM "Out"
-        if (oldPosition === 'Out' && position !== 'Out') {
-            state.sitOutCounts[player] = Math.max(0, (state.sitOutCounts[player] || 0) - 1);
-        }
-        // Increment if moving TO "Out"
-        if (position === 'Out' && oldPosition !== 'Out') {
-            state.sitOutCounts[player] = (state.sitOutCounts[player] || 0) + 1;
+        // The grid already shows the unsaved positions, so put back what is actually stored
+        if (state.currentGame && state.currentGame.id === gameId) {
+            for (const { player, inning, position } of Object.values(previous)) {
+                if (!state.lineup[inning]) {
+                    state.lineup[inning] = {};
+                }
+                if (position) {
+                    state.lineup[inning][player] = position;
+                } else {
+                    delete state.lineup[inning][player];
+                }
+            }
+            state.sitOutCounts = countSitOuts(state.lineup);
+            updateLineupTable();
         }
-        
-        // Re-render just the lineup table to update warnings and counts
-        updateLineupTable();
-    } catch (error) {
-        console.error('Failed to update position:', error);
+        alert('Failed to save lineup changes: ' + error.message);
     }
 }
 
 async function movePlayer(player, direction) {
     try {
-        await api(`/api/games/${state.currentGame.id}/order/${encodeURIComponent(player)}`, {
+        // Save queued cell edits first so the server works on the latest lineup
+        await flushLineupPositions();
+        
+        const result = await api(`/api/games/${state.currentGame.id}/order/${encodeURIComponent(player)}`, {
             method: 'PUT',
             body: JSON.stringify({ direction })
         });
         
-        // Reload just the lineup data (not the entire page)
-        const lineupData = await api(`/api/games/${state.currentGame.id}/lineup`);
-        state.availablePlayers = lineupData.availablePlayers;
-        state.genders = lineupData.genders;
-        state.lineup = lineupData.lineup;
-        state.sitOutCounts = lineupData.sitOutCounts;
+        // Only the kicking order changed, and the response carries it
+        state.availablePlayers = result.availablePlayers;
         
         // Re-render just the lineup table
         updateLineupTable();
@@ -849,16 +1056,30 @@ async function movePlayer(player, direction) {
     }
 }
 
+function countSitOuts(lineup) {
+    const counts = {};
+    for (const positions of Object.values(lineup)) {
+        for (const [player, position] of Object.entries(positions)) {
+            if (position === 'Out') {
+                counts[player] = (counts[player] || 0) + 1;
+            }
+        }
+    }
+    return counts;
+}
+
 async function copyInning() {
     try {
+        // Save queued cell edits first so the server works on the latest lineup
+        await flushLineupPositions();
+        
         await api(`/api/games/${state.currentGame.id}/lineup/copy`, { method: 'POST' });
         
-        // Reload just the lineup data (not the entire page)
-        const lineupData = await api(`/api/games/${state.currentGame.id}/lineup`);
-        state.availablePlayers = lineupData.availablePlayers;
-        state.genders = lineupData.genders;
-        state.lineup = lineupData.lineup;
-        state.sitOutCounts = lineupData.sitOutCounts;
+        // Apply the same copy locally; the local lineup is already current
+        for (let inning = 2; inning <= 7; inning++) {
+            state.lineup[inning] = { ...(state.lineup[1] || {}) };
+        }
+        state.sitOutCounts = countSitOuts(state.lineup);
         
         // Re-render just the lineup table
         updateLineupTable();
@@ -871,14 +1092,14 @@ async function resetLineup() {
     if (!confirm('Are you sure you want to reset all lineup positions?')) return;
     
     try {
+        // Save queued cell edits first so the server works on the latest lineup
+        await flushLineupPositions();
+        
         await api(`/api/games/${state.currentGame.id}/lineup/reset`, { method: 'POST' });
         
-        // Reload just the lineup data (not the entire page)
-        const lineupData = await api(`/api/games/${state.currentGame.id}/lineup`);
-        state.availablePlayers = lineupData.availablePlayers;
-        state.genders = lineupData.genders;
-        state.lineup = lineupData.lineup;
-        state.sitOutCounts = lineupData.sitOutCounts;
+        // Nothing to reload: every position is now empty
+        state.lineup = {};
+        state.sitOutCounts = {};
         
         // Re-render just the lineup table
         updateLineupTable();
@@ -938,6 +1159,9 @@ function toggleCollapsible(header) {
 
 async function publishLineup() {
     try {
+        // Save queued edits first so the snapshot has the latest lineup and IN/OUT statuses
+        await flushAll();
+        
         await api(`/api/games/${state.currentGame.id}/publish`, { method: 'POST' });
         
         // Update local state
@@ -956,6 +1180,9 @@ async function unpublishLineup() {
     if (!confirm('Unpublish this lineup? It will no longer be visible to the public.')) return;
     
     try {
+        // Save queued edits before the re-render below redraws the inputs from state
+        await flushAll();
+        
         await api(`/api/games/${state.currentGame.id}/unpublish`, { method: 'POST' });
         
         // Update local state
@@ -1026,14 +1253,12 @@ function renderRoster(roster, substitutes, users = []) {
             </div>
             <div class="roster-item-actions">
                 <button class="gender-btn ${player.isFemale ? 'female' : 'male'}" 
-                        onclick="toggleRosterGender('${escapeHtml(player.name)}')"
+                        data-action="toggleRosterGender" data-name="${escapeHtml(player.name)}"
                         title="Toggle gender">
                     ${player.isFemale ? '♀' : '♂'}
                 </button>
-                <button class="btn btn-ghost btn-sm" 
-                        onclick="deleteRosterPlayer('${escapeHtml(player.name)}')">
-                    Delete
-                </button>
+                <input type="checkbox" class="roster-select" value="${escapeHtml(player.name)}"
+                       title="Select for deletion">
             </div>
         </div>
     `).join('');
@@ -1046,14 +1271,12 @@ function renderRoster(roster, substitutes, users = []) {
             </div>
             <div class="roster-item-actions">
                 <button class="gender-btn ${player.isFemale ? 'female' : 'male'}" 
-                        onclick="toggleSubGender('${escapeHtml(player.name)}')"
+                        data-action="toggleSubGender" data-name="${escapeHtml(player.name)}"
                         title="Toggle gender">
                     ${player.isFemale ? '♀' : '♂'}
                 </button>
-                <button class="btn btn-ghost btn-sm" 
-                        onclick="deleteSubstitute('${escapeHtml(player.name)}')">
-                    Delete
-                </button>
+                <input type="checkbox" class="roster-select" value="${escapeHtml(player.name)}"
+                       title="Select for deletion">
             </div>
         </div>
     `).join('');
@@ -1067,7 +1290,7 @@ function renderRoster(roster, substitutes, users = []) {
             <div class="roster-item-actions">
                 ${user.username !== state.username ? `
                     <button class="btn btn-ghost btn-sm" 
-                            onclick="deleteUser(${user.id}, '${escapeHtml(user.username)}')">
+                            data-action="deleteUser" data-id="${user.id}" data-name="${escapeHtml(user.username)}">
                         Delete
                     </button>
                 ` : ''}
@@ -1095,7 +1318,7 @@ function renderRoster(roster, substitutes, users = []) {
             </form>
             
             <div class="roster-list">
-                ${rosterListHtml || '<p class="text-muted">No players yet</p>'}
+                ${rosterListHtml ? rosterListHtml + deleteSelectedButton('deleteRosterPlayers') : '<p class="text-muted">No players yet</p>'}
             </div>
         </div>
         
@@ -1118,7 +1341,7 @@ function renderRoster(roster, substitutes, users = []) {
             </form>
             
             <div class="roster-list">
-                ${subsListHtml || '<p class="text-muted">No substitutes yet</p>'}
+                ${subsListHtml ? subsListHtml + deleteSelectedButton('deleteSubstitutes') : '<p class="text-muted">No substitutes yet</p>'}
             </div>
         </div>
         
@@ -1146,6 +1369,35 @@ function renderRoster(roster, substitutes, users = []) {
             </div>
         </div>
     `;
+    
+    // One delegated listener per list instead of inline handlers on every row
+    panel.querySelectorAll('.roster-list').forEach(list => {
+        list.addEventListener('click', handleRosterListClick);
+    });
+}
+
+function deleteSelectedButton(action) {
+    return `<button class="btn btn-ghost btn-sm" data-action="${action}">Delete Selected</button>`;
+}
+
+function selectedRosterNames(button) {
+    const list = button.closest('.roster-list');
+    return [...list.querySelectorAll('.roster-select:checked')].map(box => box.value);
+}
+
+const rosterActions = {
+    toggleRosterGender: button => toggleRosterGender(button.dataset.name),
+    deleteRosterPlayers: button => deleteRosterPlayers(selectedRosterNames(button)),
+    toggleSubGender: button => toggleSubGender(button.dataset.name),
+    deleteSubstitutes: button => deleteSubstitutes(selectedRosterNames(button)),
+    deleteUser: button => deleteUser(parseInt(button.dataset.id), button.dataset.name)
+};
+
+function handleRosterListClick(event) {
+    const button = event.target.closest('[data-action]');
+    if (button && rosterActions[button.dataset.action]) {
+        rosterActions[button.dataset.action](button);
+    }
 }
 
 async function addPlayer(event) {
@@ -1179,11 +1431,11 @@ async function addPlayer(event) {
     }
 }
 
-async function deleteRosterPlayer(name) {
-    if (!confirm(`Delete ${name} from roster?`)) return;
+async function deleteRosterPlayers(names) {
+    if (names.length === 0 || !confirm(`Delete ${names.join(', ')} from roster?`)) return;
     
     try {
-        await api(`/api/roster/${encodeURIComponent(name)}`, { method: 'DELETE' });
+        await api('/api/roster', { method: 'DELETE', body: JSON.stringify({ names }) });
         await refreshRosterData();
     } catch (error) {
         alert(error.message);
@@ -1230,11 +1482,11 @@ async function addSubstitute(event) {
     }
 }
 
-async function deleteSubstitute(name) {
-    if (!confirm(`Delete ${name} from substitutes?`)) return;
+async function deleteSubstitutes(names) {
+    if (names.length === 0 || !confirm(`Delete ${names.join(', ')} from substitutes?`)) return;
     
     try {
-        await api(`/api/substitutes/${encodeURIComponent(name)}`, { method: 'DELETE' });
+        await api('/api/substitutes', { method: 'DELETE', body: JSON.stringify({ names }) });
         await refreshRosterData();
     } catch (error) {
         alert(error.message);
@@ -1312,24 +1564,44 @@ async function loadViewLineup() {
     }
 }
 
-async function renderViewLineup(gameId, selectedPlayer = null) {
+function pivotByPlayer(lineupData) {
+    // {inning: {player: position}} -> {player: [position for innings 1-7]}, '-' when unset
+    const rows = {};
+    for (const player of lineupData.availablePlayers) {
+        rows[player] = [];
+        for (let inning = 1; inning <= 7; inning++) {
+            rows[player].push(lineupData.lineup[inning]?.[player] || '-');
+        }
+    }
+    return rows;
+}
+
+async function renderViewLineup(gameId, selectedPlayer = null, lineupData = null) {
     const panel = document.getElementById('viewLineupPanel');
     
     // Find the game
     const game = state.games.find(g => g.id === gameId);
     if (!game) return;
     
-    // Get published lineup data (for public view) or regular lineup (for authenticated users)
-    let lineupData;
-    if (state.authenticated) {
-        // Authenticated users can see unpublished lineups
-        lineupData = await api(`/api/games/${gameId}/lineup`);
-        lineupData.published = true; // Mark as viewable
-    } else {
-        // Public view only shows published lineups
-        lineupData = await api(`/api/games/${gameId}/lineup/published`);
+    // Get published lineup data (for public view) or regular lineup (for authenticated users).
+    // Re-renders of the same game (e.g. the player filter) pass in the data they already have.
+    if (!lineupData) {
+        if (state.authenticated) {
+            // Authenticated users can see unpublished lineups
+            lineupData = await api(`/api/games/${gameId}/lineup`);
+            lineupData.published = true; // Mark as viewable
+        } else {
+            // Public view only shows published lineups
+            lineupData = await api(`/api/games/${gameId}/lineup/published`);
+        }
     }
     
+    // Pivot once per fetch; filter re-renders reuse the same rows
+    if (!lineupData.positionsByPlayer) {
+        lineupData.positionsByPlayer = pivotByPlayer(lineupData);
+    }
+    const positionsByPlayer = lineupData.positionsByPlayer;
+    
     // Store for player filter
     state.currentViewLineup = lineupData;
     state.currentViewGameId = gameId;
@@ -1396,7 +1668,7 @@ async function renderViewLineup(gameId, selectedPlayer = null) {
             
             let inningsHtml = '';
             for (let inning = 1; inning <= 7; inning++) {
-                const position = lineupData.lineup[inning]?.[selectedPlayer] || '-';
+                const position = positionsByPlayer[selectedPlayer]?.[inning - 1] ?? '-';
                 const abbrev = position !== '-' ? (lineupData.abbreviations[position] || position) : '-';
                 const fullName = position !== '-' ? position : 'Not assigned';
                 const isOut = position === 'Out';
@@ -1433,36 +1705,43 @@ async function renderViewLineup(gameId, selectedPlayer = null) {
             }
             headerRow += '</tr>';
             
+            // Table and mobile markup depend only on the position, so build each once
+            const tableCell = {};
+            const mobileCell = {};
+            for (const position of ['-', ...lineupData.positions]) {
+                const abbrev = position !== '-' ? (lineupData.abbreviations[position] || position) : '-';
+                const isOut = position === 'Out';
+                tableCell[position] = isOut ? `<td class="out-position">${abbrev}</td>` : `<td>${abbrev}</td>`;
+                mobileCell[position] = `<span class="mobile-pos${isOut ? ' out' : ''}">${abbrev}</span>`;
+            }
+            
             let bodyRows = '';
             let mobileCardsHtml = '';
             
             lineupData.availablePlayers.forEach((player, index) => {
+                const name = escapeHtml(player);
                 const isFemale = lineupData.genders[player];
                 
                 // Desktop table row
-                bodyRows += `<tr onclick="filterByPlayer('${escapeHtml(player)}')" class="clickable-row">
+                bodyRows += `<tr data-name="${name}" class="clickable-row">
                     <td>${index + 1}</td>
-                    <td>${escapeHtml(player)}${isFemale ? ' ♀' : ''}</td>`;
+                    <td>${name}${isFemale ? ' ♀' : ''}</td>`;
                 
                 // Mobile card
                 let positionsHtml = '';
-                for (let inning = 1; inning <= 7; inning++) {
-                    const position = lineupData.lineup[inning]?.[player] || '-';
-                    const abbrev = position !== '-' ? (lineupData.abbreviations[position] || position) : '-';
-                    const isOut = position === 'Out';
-                    
-                    bodyRows += `<td class="${isOut ? 'out-position' : ''}">${abbrev}</td>`;
-                    positionsHtml += `<span class="mobile-pos ${isOut ? 'out' : ''}">${abbrev}</span>`;
+                for (const position of positionsByPlayer[player]) {
+                    bodyRows += tableCell[position] ?? `<td>${escapeHtml(position)}</td>`;
+                    positionsHtml += mobileCell[position] ?? `<span class="mobile-pos">${escapeHtml(position)}</span>`;
                 }
                 
                 bodyRows += '</tr>';
                 
                 // Mobile card for this player
                 mobileCardsHtml += `
-                    <div class="mobile-player-card" onclick="filterByPlayer('${escapeHtml(player)}')">
+                    <div class="mobile-player-card" data-name="${name}">
                         <div class="mobile-player-info">
                             <span class="mobile-player-number">#${index + 1}</span>
-                            <span class="mobile-player-name">${escapeHtml(player)}${isFemale ? ' ♀' : ''}</span>
+                            <span class="mobile-player-name">${name}${isFemale ? ' ♀' : ''}</span>
                         </div>
                         <div class="mobile-positions">
                             ${positionsHtml}
@@ -1515,6 +1794,16 @@ async function renderViewLineup(gameId, selectedPlayer = null) {
             ${contentHtml}
         </div>
     `;
+    
+    // One delegated listener for every clickable row and card
+    panel.querySelector('.card').addEventListener('click', handleViewLineupClick);
+}
+
+function handleViewLineupClick(event) {
+    const row = event.target.closest('.clickable-row, .mobile-player-card');
+    if (row) {
+        filterByPlayer(row.dataset.name);
+    }
 }
 
 async function changeViewGame(gameId) {
@@ -1526,7 +1815,7 @@ function filterByPlayer(playerName, fromPopState = false) {
         if (playerName && !fromPopState) {
             history.pushState({ view: 'playerDetail', player: playerName, gameId: state.currentViewGameId }, '');
         }
-        renderViewLineup(state.currentViewGameId, playerName || null);
+        renderViewLineup(state.currentViewGameId, playerName || null, state.currentViewLineup);
     }
 }
 
@@ -1556,11 +1845,11 @@ function closeModal(modalId) {
 // ========================================
 // Utility Functions
 // ========================================
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
 function escapeHtml(text) {
     if (!text) return '';
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
+    return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
 }
 
 // ========================================
@@ -1578,6 +1867,11 @@ document.addEventListener('DOMContentLoaded', async () => {
     
     await loadCurrentTab();
     
+    // Closing or leaving the page must not drop edits still waiting to be saved
+    window.addEventListener('pagehide', () => {
+        flushAll({ keepalive: true });
+    });
+    
     window.addEventListener('popstate', (event) => {
         if (state.currentViewGameId && state.selectedPlayer) {
             filterByPlayer(null, true);